@@ -1,10 +1,11 @@
 import os
+import uuid
 from flask import Flask, request, jsonify, render_template
-from services.translator import translate_text
-from services.currency import convert_currency
-from services.portfolio import resume_to_portfolio
 from flask_cors import CORS
 
+# Services are imported inside their routes, so a worker only loads
+# (and pays the import cost of) the services it actually serves
+
 app = Flask(__name__)
 cors = CORS(app, resources={r"/*": {"origins": "*"}})
 UPLOAD_FOLDER = "uploads"
@@ -24,6 +25,8 @@ def translate():
         if not data or "text" not in data:
             return jsonify({"error": "No text provided"}), 400
 
+        from services.translator import translate_text
+
         text = data["text"]
         dest = data.get("dest", "en")
         result = translate_text(text, dest)
@@ -45,6 +48,8 @@ def currency():
         except ValueError:
             return jsonify({"error": "Amount must be numeric"}), 400
 
+        from services.currency import convert_currency
+
         from_currency = data.get("from", "USD")
         to_currency = data.get("to", "INR")
         result = convert_currency(amount, from_currency, to_currency)
@@ -65,10 +70,19 @@ def portfolio():
             if not file or file.filename.strip() == "":
                 return jsonify({"error": "Empty filename"}), 400
 
-            save_path = os.path.join(UPLOAD_FOLDER, file.filename)
+            # Unique name per upload so concurrent requests never share a file
+            extension = os.path.splitext(file.filename)[1].lower()
+            save_path = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}{extension}")
             file.save(save_path)
 
-            portfolio_data = resume_to_portfolio(save_path)
+            try:
+                from services.portfolio import resume_to_portfolio
+
+                multilingual = request.form.get("multilingual", "").lower() in ("1", "true", "yes")
+                portfolio_data = resume_to_portfolio(save_path, multilingual)
+            finally:
+                # Raced parser backends still running work on their own copies
+                os.remove(save_path)
 
             if not portfolio_data or "error" in portfolio_data:
                 return jsonify({"error": "Could not parse resume"}), 500
@@ -82,4 +96,4 @@ def portfolio():
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True, threaded=True)
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Keeps the repo root importable (services/, tools/) under plain `pytest`,
+# not just `python -m pytest`.
@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import deque
+
+
+class CircuitBreaker:
+    """
+    Track latency and errors of one backend and skip it while it is failing.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    `allow()` refuses calls for `cool_down` seconds. After that a single
+    trial call is let through; success closes the circuit again.
+    With a `latency_budget`, calls slower than it count as failures, so a
+    backend that is slow but succeeds is skipped as well. `clock` returns
+    the current time in seconds and can be replaced in tests.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, cool_down: float = 30.0, window: int = 20,
+                 latency_budget: float = None, clock=time.monotonic):
+        self.name = name
+        self.clock = clock
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.latency_budget = latency_budget
+        self.calls = deque(maxlen=window)  # (ok, latency) of recent calls
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether the backend may be called right now."""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if self.clock() - self.opened_at >= self.cool_down:
+                # Half-open: re-arm the timer so only this caller gets the trial
+                self.opened_at = self.clock()
+                return True
+            return False
+
+    def record(self, ok: bool, latency: float):
+        """Record the outcome of one call."""
+        if self.latency_budget is not None and latency > self.latency_budget:
+            ok = False
+        with self.lock:
+            self.calls.append((ok, latency))
+            if ok:
+                self.consecutive_failures = 0
+                self.opened_at = None
+            else:
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= self.failure_threshold:
+                    self.opened_at = self.clock()
+
+    def stats(self) -> dict:
+        """Summarise recent calls for reporting."""
+        with self.lock:
+            calls = list(self.calls)
+            state = "closed" if self.opened_at is None else "open"
+        latencies = [latency for _, latency in calls]
+        return {
+            "backend": self.name,
+            "state": state,
+            "calls": len(calls),
+            "error_rate": round(sum(not ok for ok, _ in calls) / len(calls), 3) if calls else 0.0,
+            "avg_latency": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+        }
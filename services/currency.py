@@ -1,7 +1,10 @@
+from types import MappingProxyType
+
 # Mock conversion with fixed exchange rates
 # Base currency = USD
+# Read-only view, so request threads can share the table safely
 
-EXCHANGE_RATES = {
+EXCHANGE_RATES = MappingProxyType({
     "USD": 1.0,          # US Dollar
     "INR": 87.996,       # Indian Rupee  
     "EUR": 0.8473,       # Euro  
@@ -18,7 +21,7 @@ EXCHANGE_RATES = {
     "MXN": 18.328,       # Mexican Peso
     "BRL": 5.3005,       # Brazilian Real
     "ZAR": 18.055        # South African Rand
-}
+})
 
 def convert_currency(amount: float, from_currency: str, to_currency: str):
     try:
@@ -0,0 +1,100 @@
+import re
+
+from services.parser import extract_text, parse_resume_text
+from services.translator import translate_lines
+
+# ---------------- Language Detection ---------------- #
+# Non-Latin scripts identify the language (or close enough for the translator)
+SCRIPT_RANGES = {
+    "hi": r"[\u0900-\u097F]",  # Devanagari
+    "bn": r"[\u0980-\u09FF]",  # Bengali
+    "ta": r"[\u0B80-\u0BFF]",  # Tamil
+    "te": r"[\u0C00-\u0C7F]",  # Telugu
+    "ru": r"[\u0400-\u04FF]",  # Cyrillic
+    "el": r"[\u0370-\u03FF]",  # Greek
+    "iw": r"[\u0590-\u05FF]",  # Hebrew
+    "ar": r"[\u0600-\u06FF]",  # Arabic
+    "ja": r"[\u3040-\u30FF]",  # Hiragana / Katakana
+    "ko": r"[\uAC00-\uD7AF]",  # Hangul
+    "zh-CN": r"[\u4E00-\u9FFF]",  # CJK ideographs
+}
+
+# Latin-script languages are told apart by their most common words
+STOPWORDS = {
+    "en": {"the", "and", "of", "to", "in", "with", "for", "on", "at", "as"},
+    "es": {"el", "la", "de", "y", "en", "los", "las", "con", "para", "del"},
+    "fr": {"le", "la", "les", "et", "des", "du", "en", "avec", "pour", "dans"},
+    "de": {"der", "die", "und", "das", "mit", "von", "für", "im", "den", "bei"},
+    "pt": {"o", "a", "de", "e", "do", "da", "em", "com", "para", "dos"},
+    "it": {"il", "la", "di", "e", "del", "della", "con", "per", "in", "nel"},
+    "nl": {"de", "het", "en", "van", "een", "met", "voor", "bij", "in", "op"},
+}
+
+# Only the start of the document is needed to tell the language
+DETECTION_SAMPLE_CHARS = 2000
+
+# Share of kana among all letters above which text counts as Japanese
+KANA_SHARE = 0.02
+
+def detect_language(text: str) -> str:
+    """
+    Guess the language code of a resume from its script and common words.
+    Returns "auto" for Latin-script text without any known common words.
+    """
+    sample = text[:DETECTION_SAMPLE_CHARS]
+    letters = len(re.findall(r"[^\W\d_]", sample))
+    if not letters:
+        return "en"
+
+    # Japanese resumes are often mostly kanji (学歴, 職歴, ...), so any
+    # meaningful share of kana marks the text as Japanese before the CJK check
+    if len(re.findall(SCRIPT_RANGES["ja"], sample)) / letters > KANA_SHARE:
+        return "ja"
+
+    for lang, pattern in SCRIPT_RANGES.items():
+        if len(re.findall(pattern, sample)) / letters > 0.2:
+            return lang
+
+    words = re.findall(r"[^\W\d_]+", sample.lower())
+    scores = {lang: sum(word in stopwords for word in words) for lang, stopwords in STOPWORDS.items()}
+    best = max(scores, key=scores.get)
+    if not scores[best]:
+        # Only headers and field lines, no prose to judge by: let the translator detect it
+        return "auto"
+    # Prefer English on ties, since that needs no translation
+    return best if scores[best] > scores["en"] else "en"
+
+# ---------------- Line Translation ---------------- #
+# Section headers and field labels are short; long prose lines are left as-is
+MAX_FIELD_WORDS = 6
+
+def is_translatable_line(line: str) -> bool:
+    """Check whether a line is a short header/field line worth translating."""
+    if not re.search(r"[^\W\d_]", line):
+        return False
+    if re.search(r"@|https?://|www\.|\.com", line, re.I):
+        return False
+    return len(line.split()) <= MAX_FIELD_WORDS
+
+def translate_resume_text(text: str, source: str, dest_lang: str = "en", max_calls: int = 3) -> str:
+    """Translate the header and short field lines of a resume, keeping the line layout."""
+    lines = text.split("\n")
+    candidates = [line.strip() for line in lines if line.strip() and is_translatable_line(line.strip())]
+    translations = translate_lines(candidates, source, dest_lang, max_calls)
+
+    return "\n".join(translations.get(line.strip(), line) for line in lines)
+
+# ---------------- Resume Parsing ---------------- #
+def detect_resume_language(file_path: str) -> dict:
+    """Extract a resume's text and detect its language as {"text", "language"} or {"error"}."""
+    extracted = extract_text(file_path)
+    if "error" in extracted:
+        return extracted
+
+    return {"text": extracted["text"], "language": detect_language(extracted["text"])}
+
+def parse_translated_resume(text: str, language: str, max_calls: int = 3) -> dict:
+    """Translate the header and field lines of non-English resume text, then parse it."""
+    parsed = parse_resume_text(translate_resume_text(text, language, "en", max_calls))
+    parsed["language"] = language
+    return parsed
@@ -1,11 +1,14 @@
 import re
 import os
-import pdfplumber
-import docx
+
+# pdfplumber (with pdfminer) and python-docx are imported on first use,
+# since they are only needed once a resume is actually uploaded
 
 # ---------------- Resume As Text Extraction ---------------- #
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from PDF file."""
+    import pdfplumber
+
     text = ""
     try:
         with pdfplumber.open(file_path) as pdf:
@@ -19,6 +22,8 @@ def extract_text_from_pdf(file_path: str) -> str:
 
 def extract_text_from_docx(file_path: str) -> str:
     """Extract text from DOCX file."""
+    import docx
+
     try:
         doc = docx.Document(file_path)
         return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
@@ -30,13 +35,11 @@ def clean_lines(text: str):
     """Clean and return non-empty lines."""
     return [line.strip() for line in text.split("\n") if line.strip()]
 
-# ---------------- Resume Parsing ---------------- #
-def extract_resume_data(file_path: str) -> dict:
-    """Extract structured resume data from PDF or DOCX."""
+def extract_text(file_path: str) -> dict:
+    """Extract raw text from a PDF or DOCX resume as {"text": ...} or {"error": ...}."""
     if not os.path.exists(file_path):
         return {"error": "File not found"}
 
-    # Extract text
     if file_path.endswith(".pdf"):
         text = extract_text_from_pdf(file_path)
     elif file_path.endswith(".docx"):
@@ -47,6 +50,19 @@ def extract_resume_data(file_path: str) -> dict:
     if not text:
         return {"error": "Could not extract text from file"}
 
+    return {"text": text}
+
+# ---------------- Resume Parsing ---------------- #
+def extract_resume_data(file_path: str) -> dict:
+    """Extract structured resume data from PDF or DOCX."""
+    extracted = extract_text(file_path)
+    if "error" in extracted:
+        return extracted
+
+    return parse_resume_text(extracted["text"])
+
+def parse_resume_text(text: str) -> dict:
+    """Extract structured resume data from already extracted resume text."""
     lines = clean_lines(text)
     full_text = " ".join(lines)
 
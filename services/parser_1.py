@@ -1,24 +1,61 @@
-import pdfplumber
-import docx
 import re
 from typing import List, Dict, Optional
-import spacy
 from datetime import datetime
 import logging
+import queue
+import threading
+from contextlib import contextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    # Load the English language model
-    nlp = spacy.load("en_core_web_sm")
-except:
-    logger.warning("Spacy model not found. Some features will be limited.")
-    nlp = None
+# spaCy pipelines are not safe to share between request threads, and each
+# one costs seconds and tens of MB to load, so a small bounded pool of them
+# is loaded on demand and checked out per call
+NLP_POOL_SIZE = 2
+_nlp_pool = queue.Queue()
+_nlp_lock = threading.Lock()
+_nlp_loaded = 0
+_nlp_unavailable = False
+
+@contextmanager
+def borrow_nlp():
+    """Check out a spaCy pipeline from the pool (None if the model is unavailable)."""
+    global _nlp_loaded, _nlp_unavailable
+    try:
+        nlp = _nlp_pool.get_nowait()
+    except queue.Empty:
+        with _nlp_lock:
+            load = not _nlp_unavailable and _nlp_loaded < NLP_POOL_SIZE
+            if load:
+                _nlp_loaded += 1
+        if _nlp_unavailable:
+            yield None
+            return
+        if load:
+            try:
+                # Load the English language model (spaCy is imported lazily, it is slow to import)
+                import spacy
+                nlp = spacy.load("en_core_web_sm")
+            except:
+                logger.warning("Spacy model not found. Some features will be limited.")
+                _nlp_unavailable = True
+                # None goes back into the pool too, so waiting threads wake up
+                nlp = None
+        else:
+            # Pool is full: wait for another thread to hand a pipeline back
+            nlp = _nlp_pool.get()
+
+    try:
+        yield nlp
+    finally:
+        _nlp_pool.put(nlp)
 
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text content from PDF file with improved error handling."""
+    import pdfplumber
+
     text = ""
     try:
         with pdfplumber.open(file_path) as pdf:
@@ -34,6 +71,8 @@ def extract_text_from_pdf(file_path: str) -> str:
 
 def extract_text_from_docx(file_path: str) -> str:
     """Extract text content from DOCX file."""
+    import docx
+
     doc = docx.Document(file_path)
     return "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
 
@@ -79,12 +118,13 @@ def extract_contact_info(text: str) -> Dict[str, str]:
         contact_info['linkedin'] = 'https://www.' + linkedin_match.group()
     
     # Location (if NLP is available)
-    if nlp:
-        doc = nlp(text[:1000])  # Process first 1000 chars for efficiency
-        for ent in doc.ents:
-            if ent.label_ in ['GPE', 'LOC']:
-                contact_info['location'] = ent.text
-                break
+    with borrow_nlp() as nlp:
+        if nlp:
+            doc = nlp(text[:1000])  # Process first 1000 chars for efficiency
+            for ent in doc.ents:
+                if ent.label_ in ['GPE', 'LOC']:
+                    contact_info['location'] = ent.text
+                    break
     
     return contact_info
 
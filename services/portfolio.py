@@ -1,46 +1,209 @@
-try:
-    from resume_parser import resumeparse
-    USE_RESUME_PARSER = True
-except Exception as e:
-    print("⚠️ resume-parser not available:", e)
-    USE_RESUME_PARSER = False
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 from services.parser import extract_resume_data  # fallback
+from services.multilingual import detect_resume_language, parse_translated_resume
+from services.circuit_breaker import CircuitBreaker
 
+# Racing runs all healthy backends at once and keeps the first good result
+RACE_BACKENDS = False
+RACE_DEADLINE_SECONDS = 10.0
 
-def resume_to_portfolio(file_path: str) -> dict:
+# resume-parser calls slower than this count as failures for its breaker
+LATENCY_BUDGET_SECONDS = 5.0
+
+
+def parse_with_resume_parser(file_path: str) -> dict:
+    """Parse a resume with resume-parser and map it to portfolio-ready JSON."""
+    parsed = resumeparse.read_file(file_path)
+
+    return {
+        "hero": {
+            "name": parsed.get("name", "Unknown"),
+            "bio": "Auto-extracted from resume"
+        },
+        "about": {
+            "summary": parsed.get("total_exp", "") 
+                       or "Motivated professional seeking opportunities."
+        },
+        "skills": parsed.get("skills", []),
+        "experience": parsed.get("experience", []),
+        "education": parsed.get("education", []),
+        "certifications": parsed.get("certifications", []),
+        "contact": {
+            "email": parsed.get("email", ""),
+            "phone": parsed.get("phone", ""),
+            "linkedin": parsed.get("linkedin", ""),
+            "github": parsed.get("github", "")
+        }
+    }
+
+
+# In order of preference; the regex parser is always last as the fallback.
+# Built on first use so importing this module stays cheap.
+BACKENDS = []
+_backends_lock = threading.Lock()
+
+# resume-parser pulls in spaCy/nltk, so it is only imported by get_backends()
+resumeparse = None
+
+
+def get_backends() -> list:
+    """Parser backends, probing for resume-parser on the first call."""
+    global resumeparse
+    with _backends_lock:
+        if not BACKENDS:
+            try:
+                # The submodule import is what fails when the spaCy model or nltk data is missing
+                from resume_parser import resumeparse as module
+                resumeparse = module
+                BACKENDS.append((CircuitBreaker("resume_parser", latency_budget=LATENCY_BUDGET_SECONDS),
+                                 parse_with_resume_parser))
+            except Exception as e:
+                print("⚠️ resume-parser not available:", e)
+            BACKENDS.append((CircuitBreaker("parser"), extract_resume_data))
+    return BACKENDS
+
+
+def backend_stats() -> list:
+    """Latency, error rate and circuit state of each parser backend."""
+    return [breaker.stats() for breaker, _ in get_backends()]
+
+
+def select_backends() -> list:
+    """
+    Healthy backends in order of preference, skipping those whose circuit
+    is open. The fallback parser is kept even when its own circuit is open.
+    """
+    backends = get_backends()
+    selected = [backend for backend in backends if backend[0].allow()]
+    return selected or [backends[-1]]
+
+
+def run_backend(breaker: CircuitBreaker, parse, file_path: str, claim=None) -> dict:
+    """
+    Run one backend and record its outcome and latency. In a race, `claim`
+    decides whether this outcome is still recorded (see race_backends).
+    """
+    start = breaker.clock()
+    try:
+        result = parse(file_path)
+    except Exception as e:
+        print(f"⚠️ {breaker.name} failed:", e)
+        result = {"error": str(e)}
+
+    if claim is None or claim():
+        breaker.record(bool(result) and "error" not in result, breaker.clock() - start)
+    return result
+
+
+def run_on_copy(breaker: CircuitBreaker, parse, file_path: str, claim=None) -> dict:
+    """
+    Run a raced backend on its own link/copy of the upload, removed once the
+    call finishes, so the caller may delete the upload while it still runs.
+    """
+    copy_path = os.path.join(os.path.dirname(file_path),
+                             f"{uuid.uuid4().hex}{os.path.splitext(file_path)[1]}")
+    try:
+        os.link(file_path, copy_path)
+    except OSError:
+        shutil.copyfile(file_path, copy_path)
+    try:
+        return run_backend(breaker, parse, copy_path, claim)
+    finally:
+        os.remove(copy_path)
+
+
+def one_shot():
+    """Return a callable that is True for its first caller only, across threads."""
+    lock = threading.Lock()
+    return lambda: lock.acquire(blocking=False)
+
+
+def race_backends(backends: list, file_path: str) -> dict:
+    """
+    Run backends concurrently and return the first good result within the
+    deadline. Each call is recorded exactly once: a backend still running at
+    the deadline is recorded as a failure then, and its late outcome is
+    ignored. If the fallback parser is still running at the deadline, the
+    race waits for it; if it was not raced at all, it is run directly.
+    """
+    # A pool per race, so calls stuck past the deadline never delay other requests
+    pool = ThreadPoolExecutor(max_workers=len(backends), thread_name_prefix="portfolio-race")
+    futures = {}
+    for breaker, parse in backends:
+        claim = one_shot()
+        futures[pool.submit(run_on_copy, breaker, parse, file_path, claim)] = (breaker, claim)
+    pool.shutdown(wait=False)
+    deadline = time.monotonic() + RACE_DEADLINE_SECONDS
+
+    result = None
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            result = future.result()
+            if result and "error" not in result:
+                for straggler in pending:
+                    straggler.cancel()
+                return result
+
+    fallback_breaker, fallback = get_backends()[-1]
+    fallback_future = next((future for future, (breaker, _) in futures.items() if breaker is fallback_breaker), None)
+
+    for future in pending:
+        breaker, claim = futures[future]
+        if future is not fallback_future and not future.cancel() and claim():
+            breaker.record(False, RACE_DEADLINE_SECONDS)
+
+    if fallback_future is None:
+        # Its circuit was open, so it was not raced; it is still always attempted
+        return run_backend(fallback_breaker, fallback, file_path)
+    if fallback_future in pending:
+        # Already parsing: wait for that call rather than starting a second one
+        return fallback_future.result()
+    return result or {"error": "No parser backend finished in time"}
+
+
+def resume_to_portfolio(file_path: str, multilingual: bool = False, race: bool = None) -> dict:
     """
     Convert a resume file into portfolio-ready JSON.
     Try to use resume-parser if available, else falls back to custom parser.
+    With `multilingual`, the language is detected first: English resumes go
+    through the normal backends, while non-English ones get their header and
+    field lines translated and are parsed by the regex parser, the only
+    backend that works on text rather than a file.
+    A backend that keeps failing (or exceeding its latency budget) is skipped
+    for a cool-down period, and with `race` all healthy backends run at once
+    and the first good result wins.
     """
 
-    if USE_RESUME_PARSER:
-        try:
-            parsed = resumeparse.read_file(file_path)
-
-            return {
-                "hero": {
-                    "name": parsed.get("name", "Unknown"),
-                    "bio": "Auto-extracted from resume"
-                },
-                "about": {
-                    "summary": parsed.get("total_exp", "") 
-                               or "Motivated professional seeking opportunities."
-                },
-                "skills": parsed.get("skills", []),
-                "experience": parsed.get("experience", []),
-                "education": parsed.get("education", []),
-                "certifications": parsed.get("certifications", []),
-                "contact": {
-                    "email": parsed.get("email", ""),
-                    "phone": parsed.get("phone", ""),
-                    "linkedin": parsed.get("linkedin", ""),
-                    "github": parsed.get("github", "")
-                }
-            }
-
-        except Exception as e:
-            print("⚠️ resume-parser failed, falling back:", e)
-
-    # fallback to regex parser if resume-parser is unavailable/broken
-    return extract_resume_data(file_path)
\ No newline at end of file
+    if multilingual:
+        detected = detect_resume_language(file_path)
+        if "error" in detected:
+            return detected
+        if detected["language"] != "en":
+            return parse_translated_resume(detected["text"], detected["language"])
+
+    if RACE_BACKENDS if race is None else race:
+        return race_backends(select_backends(), file_path)
+
+    result = None
+    backends = get_backends()
+    for index, (breaker, parse) in enumerate(backends):
+        # Checked lazily so a half-open trial is only used when actually run
+        is_fallback = index == len(backends) - 1
+        if not breaker.allow() and not is_fallback:
+            continue
+        result = run_backend(breaker, parse, file_path)
+        if result and "error" not in result:
+            return result
+
+    # every backend failed; hand back the last (fallback) error
+    return result
@@ -1,4 +1,24 @@
-from deep_translator import GoogleTranslator
+import threading
+
+# deep_translator is imported on first use (see get_translator_class);
+# assigning a class here replaces the backend, e.g. with a local fake
+GoogleTranslator = None
+
+# Translations of resume lines, cached per (source, dest) language pair
+TRANSLATION_CACHE = {}
+CACHE_LOCK = threading.Lock()
+MAX_CACHE_ENTRIES = 5000
+
+# GoogleTranslator rejects payloads above 5000 characters
+MAX_CHUNK_CHARS = 4500
+
+def get_translator_class():
+    """Return the translator backend class, importing deep_translator if needed."""
+    global GoogleTranslator
+    if GoogleTranslator is None:
+        from deep_translator import GoogleTranslator as translator_class
+        GoogleTranslator = translator_class
+    return GoogleTranslator
 
 def translate_text(text: str, dest_lang: str = "en"):
     """Translate text to the target language (default = English)."""
@@ -6,11 +26,54 @@ def translate_text(text: str, dest_lang: str = "en"):
         return {"error": "No text provided"}
     
     try:
-        translated = GoogleTranslator(source="auto", target=dest_lang).translate(text)
+        translated = get_translator_class()(source="auto", target=dest_lang).translate(text)
         return {
             "original": text,
             "translated": translated,
             "dest_lang": dest_lang
         }
     except Exception as e:
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
+
+def translate_lines(lines: list, source: str = "auto", dest_lang: str = "en", max_calls: int = 3) -> dict:
+    """
+    Translate short lines in newline-joined batches, reusing cached results.
+    Returns a {line: translation} mapping; lines left over once `max_calls`
+    translator requests are spent are simply missing from it.
+    """
+    with CACHE_LOCK:
+        cache = TRANSLATION_CACHE.setdefault((source, dest_lang), {})
+        if len(cache) > MAX_CACHE_ENTRIES:
+            cache.clear()
+        known = {line: cache[line] for line in lines if line in cache}
+    pending = [line for line in dict.fromkeys(lines) if line not in known]
+
+    # Group pending lines into chunks the translator accepts in one request
+    chunks, current, size = [], [], 0
+    for line in pending:
+        if current and size + len(line) + 1 > MAX_CHUNK_CHARS:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        chunks.append(current)
+
+    if chunks:
+        translator = get_translator_class()(source=source, target=dest_lang)
+    for chunk in chunks[:max_calls]:
+        try:
+            translated = translator.translate("\n".join(chunk)) or ""
+        except Exception as e:
+            print("⚠️ translation failed:", e)
+            continue
+
+        # Only trust the batch if the translator kept the line structure intact
+        translated_lines = translated.split("\n")
+        if len(translated_lines) == len(chunk):
+            results = {original: result.strip() or original for original, result in zip(chunk, translated_lines)}
+            known.update(results)
+            with CACHE_LOCK:
+                cache.update(results)
+
+    return known
@@ -0,0 +1,172 @@
+import os
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import services.portfolio as portfolio
+from services.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingBreaker(CircuitBreaker):
+    """Breaker that signals every recorded outcome."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorded = threading.Event()
+
+    def record(self, ok, latency):
+        super().record(ok, latency)
+        self.recorded.set()
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, cool_down=60, clock=FakeClock())
+    for _ in range(2):
+        breaker.record(False, 0.1)
+    assert breaker.allow()
+    breaker.record(False, 0.1)
+    assert not breaker.allow()
+    assert breaker.stats()["state"] == "open"
+
+
+def test_half_open_trial_closes_or_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, cool_down=30, clock=clock)
+    breaker.record(False, 0.1)
+    clock.now = 29.9
+    assert not breaker.allow()
+
+    clock.now = 30.0
+    assert breaker.allow()       # the single half-open trial
+    assert not breaker.allow()   # nobody else while it runs
+    breaker.record(False, 0.1)
+    assert not breaker.allow()   # failed trial reopens
+
+    clock.now = 60.0
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.allow() and breaker.stats()["state"] == "closed"
+
+
+def test_slow_successes_count_as_failures():
+    breaker = CircuitBreaker("test", failure_threshold=2, cool_down=60, latency_budget=1.0, clock=FakeClock())
+    breaker.record(True, 0.5)
+    breaker.record(True, 2.0)
+    breaker.record(True, 3.0)
+    assert not breaker.allow()
+    assert breaker.stats()["error_rate"] == pytest.approx(2 / 3, abs=0.001)
+
+
+def test_slow_backend_is_skipped_in_sequential_mode(monkeypatch):
+    clock = FakeClock()
+    calls = []
+
+    def slow(file_path):
+        calls.append(file_path)
+        clock.now += 1.0  # succeeds, but over its latency budget
+        return {"hero": {"name": "slow"}}
+
+    slow_breaker = CircuitBreaker("slow", failure_threshold=3, cool_down=60, latency_budget=0.3, clock=clock)
+    monkeypatch.setattr(portfolio, "BACKENDS", [
+        (slow_breaker, slow),
+        (CircuitBreaker("parser", clock=clock), lambda file_path: {"hero": {"name": "fallback"}}),
+    ])
+
+    results = [portfolio.resume_to_portfolio("resume.pdf") for _ in range(4)]
+    assert len(calls) == 3
+    assert slow_breaker.stats()["state"] == "open"
+    assert results[-1] == {"hero": {"name": "fallback"}}
+
+
+@pytest.fixture
+def race(monkeypatch, tmp_path):
+    """A primary backend that hangs until released, racing a fallback set per test."""
+    state = types.SimpleNamespace(release=threading.Event(), started=threading.Event(),
+                            finished=threading.Event(), read=[], fallback_calls=0)
+
+    def hanging(file_path):
+        state.started.set()
+        state.release.wait(5)
+        with open(file_path) as f:
+            state.read.append(f.read())
+        return {"hero": {"name": "slow"}}
+
+    state.slow_breaker = RecordingBreaker("slow", failure_threshold=3, cool_down=60)
+    state.fallback_breaker = RecordingBreaker("parser")
+
+    def use_fallback(fallback):
+        def counted(file_path):
+            state.fallback_calls += 1
+            return fallback(file_path)
+        monkeypatch.setattr(portfolio, "BACKENDS", [(state.slow_breaker, hanging),
+                                                    (state.fallback_breaker, counted)])
+    state.use_fallback = use_fallback
+
+    # Signal when a raced call (including its copy cleanup) is completely done
+    run_on_copy = portfolio.run_on_copy
+
+    def tracked(*args):
+        try:
+            return run_on_copy(*args)
+        finally:
+            if args[0] is state.slow_breaker:
+                state.finished.set()
+    monkeypatch.setattr(portfolio, "run_on_copy", tracked)
+    monkeypatch.setattr(portfolio, "RACE_DEADLINE_SECONDS", 0.05)
+
+    state.upload = tmp_path / "resume.pdf"
+    state.upload.write_text("slow")
+    yield state
+    state.release.set()
+
+
+def test_race_returns_fallback_while_slow_backend_hangs(race):
+    race.use_fallback(lambda file_path: {"hero": {"name": "fallback"}})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: portfolio.resume_to_portfolio(str(race.upload), race=True), range(8)))
+    assert all(result == {"hero": {"name": "fallback"}} for result in results)
+    assert not race.release.is_set()  # answered while the primary was still hanging
+
+
+def test_race_records_missed_deadline_once(race):
+    race.use_fallback(lambda file_path: {"error": "Could not extract text from file"})
+
+    result = portfolio.resume_to_portfolio(str(race.upload), race=True)
+    os.remove(race.upload)  # the app deletes the upload as soon as the race returns
+    assert result == {"error": "Could not extract text from file"}
+    assert race.slow_breaker.stats()["calls"] == 1   # the missed deadline
+
+    race.release.set()
+    assert race.finished.wait(5)
+    assert race.slow_breaker.stats()["calls"] == 1   # the late outcome is not counted again
+    # The late call read its own copy, and the copy is gone again
+    assert race.read == ["slow"]
+    assert os.listdir(race.upload.parent) == []
+
+
+def test_race_waits_for_in_flight_fallback_instead_of_rerunning(race):
+    def fallback(file_path):
+        # Still parsing when the deadline passes and the primary's miss is recorded
+        assert race.slow_breaker.recorded.wait(5)
+        return {"hero": {"name": "fallback"}}
+    race.use_fallback(fallback)
+
+    result = portfolio.resume_to_portfolio(str(race.upload), race=True)
+    assert result == {"hero": {"name": "fallback"}}
+    assert race.fallback_calls == 1
+    assert race.fallback_breaker.stats()["calls"] == 1
+    assert race.fallback_breaker.stats()["error_rate"] == 0.0
+    assert race.slow_breaker.stats()["calls"] == 1
@@ -0,0 +1,65 @@
+import sys
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import services.parser_1 as parser_1
+import services.translator as translator
+from tools.stub_translator import StubTranslator
+
+
+def test_translate_lines_is_consistent_across_threads(monkeypatch):
+    monkeypatch.setattr(translator, "GoogleTranslator", StubTranslator)
+    monkeypatch.setattr(translator, "TRANSLATION_CACHE", {})
+
+    def call(i):
+        lines = [f"Encabezado {i % 20}", "Experiencia"]
+        source = ("es", "fr")[i % 2]
+        return source, lines, translator.translate_lines(lines, source, "en")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(call, range(400)))
+
+    for source, lines, result in results:
+        assert result == {line: f"[{source}>en] {line}" for line in lines}
+    # 20 headers alternate between the two sources, plus "Experiencia" for each
+    assert {pair: len(cache) for pair, cache in translator.TRANSLATION_CACHE.items()} == {
+        ("es", "en"): 11, ("fr", "en"): 11
+    }
+
+
+def test_nlp_pool_is_bounded(monkeypatch):
+    loads = []
+    lock = threading.Lock()
+
+    def load(name):
+        with lock:
+            loads.append(name)
+        return lambda text: types.SimpleNamespace(ents=[])
+
+    monkeypatch.setitem(sys.modules, "spacy", types.SimpleNamespace(load=load))
+    monkeypatch.setattr(parser_1, "_nlp_pool", parser_1.queue.Queue())
+    monkeypatch.setattr(parser_1, "_nlp_loaded", 0)
+    monkeypatch.setattr(parser_1, "_nlp_unavailable", False)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: parser_1.extract_contact_info("maria@example.com"), range(200)))
+
+    assert all(result["email"] == "maria@example.com" for result in results)
+    assert len(loads) <= parser_1.NLP_POOL_SIZE
+    assert parser_1._nlp_pool.qsize() == len(loads)
+
+
+def test_nlp_pool_does_not_hang_without_model(monkeypatch):
+    def load(name):
+        raise OSError("model not installed")
+
+    monkeypatch.setitem(sys.modules, "spacy", types.SimpleNamespace(load=load))
+    monkeypatch.setattr(parser_1, "_nlp_pool", parser_1.queue.Queue())
+    monkeypatch.setattr(parser_1, "_nlp_loaded", 0)
+    monkeypatch.setattr(parser_1, "_nlp_unavailable", False)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: parser_1.extract_contact_info("Berlin"), range(50)))
+
+    assert all(result["location"] == "" for result in results)
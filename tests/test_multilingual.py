@@ -0,0 +1,25 @@
+from services.multilingual import detect_language, is_translatable_line
+
+
+def test_detects_kanji_heavy_japanese():
+    text = "職務経歴書\n山田太郎\n東京大学工学部卒業\n株式会社日立製作所 ソフトウェア開発"
+    assert detect_language(text) == "ja"
+
+
+def test_detects_chinese_without_kana():
+    assert detect_language("教育背景\n北京大学 计算机科学\n工作经验") == "zh-CN"
+
+
+def test_detects_latin_languages_by_stopwords():
+    assert detect_language("Experiencia profesional en el desarrollo de la web con Python") == "es"
+    assert detect_language("Worked with the team on the release of the product") == "en"
+
+
+def test_only_short_field_lines_are_translated():
+    assert is_translatable_line("Experiencia")
+    assert not is_translatable_line("foo@example.com")
+    assert not is_translatable_line("una descripción muy larga de más de seis palabras aquí")
+
+
+def test_headers_only_latin_text_is_left_to_the_translator():
+    assert detect_language("Formación\nExperiencia laboral\nHabilidades\nIdiomas") == "auto"
@@ -0,0 +1,48 @@
+import pytest
+
+import services.portfolio as portfolio
+from services.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    """Record which parser backends get called."""
+    calls = []
+
+    def primary(file_path):
+        calls.append("primary")
+        return {"hero": {"name": "primary"}}
+
+    monkeypatch.setattr(portfolio, "BACKENDS", [
+        (CircuitBreaker("resume_parser"), primary),
+        (CircuitBreaker("parser"), lambda file_path: {"hero": {"name": "fallback"}}),
+    ])
+    return calls
+
+
+def test_multilingual_english_resume_uses_normal_backends(backends, monkeypatch):
+    monkeypatch.setattr(portfolio, "detect_resume_language",
+                        lambda file_path: {"text": "Experience", "language": "en"})
+    monkeypatch.setattr(portfolio, "parse_translated_resume",
+                        lambda text, language: pytest.fail("English resumes are not translated"))
+
+    assert portfolio.resume_to_portfolio("resume.pdf", multilingual=True) == {"hero": {"name": "primary"}}
+    assert backends == ["primary"]
+
+
+def test_multilingual_foreign_resume_is_translated(backends, monkeypatch):
+    monkeypatch.setattr(portfolio, "detect_resume_language",
+                        lambda file_path: {"text": "Experiencia", "language": "es"})
+    monkeypatch.setattr(portfolio, "parse_translated_resume",
+                        lambda text, language: {"translated": text, "language": language})
+
+    result = portfolio.resume_to_portfolio("resume.pdf", multilingual=True)
+    assert result == {"translated": "Experiencia", "language": "es"}
+    assert backends == []
+
+
+def test_multilingual_passes_extraction_errors_through(backends, monkeypatch):
+    monkeypatch.setattr(portfolio, "detect_resume_language", lambda file_path: {"error": "File not found"})
+
+    assert portfolio.resume_to_portfolio("missing.pdf", multilingual=True) == {"error": "File not found"}
+    assert backends == []
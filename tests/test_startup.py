@@ -0,0 +1,55 @@
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import services.portfolio as portfolio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies that must only be imported on first use of their route
+HEAVY_MODULES = ["deep_translator", "pdfplumber", "pdfminer", "docx", "spacy", "nltk", "resume_parser"]
+
+SERVICES = ["services.translator", "services.currency", "services.parser", "services.parser_1",
+            "services.multilingual", "services.portfolio", "services.circuit_breaker"]
+
+
+def heavy_modules_after_import(*modules):
+    """Import `modules` in a fresh interpreter and list the heavy modules it loaded."""
+    code = "; ".join(
+        ["import json, sys"]
+        + [f"import {module}" for module in modules]
+        + [f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"]
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", SERVICES)
+def test_importing_a_service_loads_no_heavy_dependencies(module):
+    assert heavy_modules_after_import(module) == []
+
+
+@pytest.mark.skipif(importlib.util.find_spec("flask") is None, reason="Flask is not installed")
+def test_importing_app_loads_no_heavy_dependencies():
+    assert heavy_modules_after_import("app") == []
+
+
+def test_broken_resume_parser_is_not_registered(monkeypatch):
+    # The package imports, but its resumeparse submodule fails (e.g. missing spaCy model)
+    broken = types.ModuleType("resume_parser")
+    broken.__path__ = []
+    monkeypatch.setitem(sys.modules, "resume_parser", broken)
+    monkeypatch.setitem(sys.modules, "resume_parser.resumeparse", None)
+    monkeypatch.setattr(portfolio, "BACKENDS", [])
+
+    assert [breaker.name for breaker, _ in portfolio.get_backends()] == ["parser"]
+
+    # Probed once only: a later working import is not picked up per request
+    monkeypatch.setitem(sys.modules, "resume_parser.resumeparse", types.ModuleType("resumeparse"))
+    assert [breaker.name for breaker, _ in portfolio.get_backends()] == ["parser"]
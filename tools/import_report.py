@@ -0,0 +1,81 @@
+"""
+Import-time report: where does startup time go?
+
+Imports the app in a fresh interpreter under `python -X importtime` and lists
+the slowest modules by cumulative and self time. With --warm, the services
+behind the given routes (and their lazily imported dependencies) are loaded
+too, showing what the first request on that route costs.
+
+Usage:
+    python tools/import_report.py
+    python tools/import_report.py --warm portfolio --top 30
+    python tools/import_report.py --warm translate,currency,portfolio
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What the first request on each route imports
+WARM_UP = {
+    "translate": "import services.translator as t; t.get_translator_class()",
+    "currency": "import services.currency",
+    "portfolio": "import services.portfolio as p; p.get_backends(); import pdfplumber, docx",
+}
+
+
+def measure(warm: list) -> list:
+    """Run the imports in a fresh interpreter; returns (self_us, cumulative_us, module) rows."""
+    code = "; ".join(["import app"] + [WARM_UP[route] for route in warm])
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"import exited with status {proc.returncode}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Per-module import timing for app startup.")
+    arg_parser.add_argument("--warm", default="", help="comma separated routes to warm up: " + ", ".join(WARM_UP))
+    arg_parser.add_argument("--top", type=int, default=20, help="modules to list")
+    args = arg_parser.parse_args()
+
+    warm = [route.strip().lstrip("/") for route in args.warm.split(",") if route.strip()]
+    unknown = [route for route in warm if route not in WARM_UP]
+    if unknown:
+        arg_parser.error(f"unknown route(s): {', '.join(unknown)}")
+
+    rows = measure(warm)
+    total_us = sum(row[0] for row in rows)
+    print(f"{len(rows)} modules imported in {total_us / 1000:.1f} ms"
+          + (f" (warmed: {', '.join(warm)})" if warm else ""))
+
+    print("\nSlowest by cumulative time (module plus everything it imported):")
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}{self_us / 1000:>10.1f}  {name}")
+
+    # Group self time by top-level package to show which dependency dominates
+    packages = {}
+    for self_us, _, name in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{self_us / 1000:>14.1f} ms  {package}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+"""
+Load-test harness for the API hub.
+
+Replays a mix of /translate, /currency and /portfolio traffic against the app
+and reports throughput, latency percentiles, error rates and the server
+process' CPU/RSS.
+
+By default the app is started in a child process ("serve" mode) with a local
+fake translation backend, so no traffic reaches Google Translate, and
+/portfolio uploads come from a generated synthetic resume corpus.
+
+Usage:
+    python tools/loadtest.py run --rate 50 --duration 30 --mix translate=2,currency=6,portfolio=2
+    python tools/loadtest.py run --replay traffic.jsonl
+    python tools/loadtest.py run --url http://127.0.0.1:5000 --pid 1234
+    python tools/loadtest.py serve --port 5001
+
+Replay logs are JSONL with one request per line:
+    {"ts": 0.25, "route": "/currency", "json": {"amount": 10, "from": "USD", "to": "EUR"}}
+"ts" (seconds from start) is optional and falls back to --rate spacing.
+Lines without a "route" (e.g. a backlog like requests.jsonl) are replayed as
+/translate requests of their "text" or "body" field.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.stub_translator import StubTranslator
+
+ROUTES = ("translate", "currency", "portfolio")
+CURRENCIES = ["USD", "INR", "EUR", "GBP", "JPY", "AUD", "CAD", "SGD"]
+DEST_LANGS = ["fr", "de", "es", "hi", "ja"]
+
+WORDS = (
+    "team project data system build design deliver customer product quality "
+    "python flask api service cloud scale release test review lead improve"
+).split()
+FIRST_NAMES = ["Asha", "Rahul", "Maria", "John", "Wei", "Fatima", "Lukas", "Sofia"]
+LAST_NAMES = ["Sharma", "Verma", "Garcia", "Smith", "Chen", "Khan", "Muller", "Rossi"]
+SKILLS = ["Python", "Flask", "SQL", "Docker", "React", "AWS", "Git", "Kubernetes", "Java", "Redis"]
+
+
+# ---------------- Stub Services ---------------- #
+def serve(port: int, translate_latency: float):
+    """Run the app with the fake translation backend installed."""
+    import services.translator
+
+    StubTranslator.latency = translate_latency
+    services.translator.GoogleTranslator = StubTranslator
+
+    # No per-request access log: it floods the terminal and inflates the measured server CPU.
+    # Startup errors still reach stderr.
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+
+    from app import app
+    app.run(host="127.0.0.1", port=port, threaded=True, debug=False)
+
+
+def build_resume_corpus(directory: str, count: int) -> list:
+    """Write `count` synthetic DOCX resumes into `directory` and return their paths."""
+    import docx
+
+    rng = random.Random(0)
+    paths = []
+    for i in range(count):
+        doc = docx.Document()
+        doc.add_paragraph(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        doc.add_paragraph(f"candidate{i}@example.com | +1 555 010 {1000 + i}")
+        doc.add_paragraph("Summary")
+        doc.add_paragraph(" ".join(rng.choices(WORDS, k=30)))
+        doc.add_paragraph("Skills")
+        doc.add_paragraph(", ".join(rng.sample(SKILLS, 5)))
+        doc.add_paragraph("Experience")
+        for _ in range(rng.randint(1, 4)):
+            start = rng.randint(2010, 2020)
+            doc.add_paragraph(f"Software Engineer at Company{rng.randint(1, 99)} {start} - {start + rng.randint(1, 4)}")
+            doc.add_paragraph(" ".join(rng.choices(WORDS, k=20)))
+        doc.add_paragraph("Education")
+        doc.add_paragraph(f"B.Tech in Computer Science, University {rng.randint(1, 30)} {rng.randint(2005, 2015)}")
+
+        path = os.path.join(directory, f"resume_{i}.docx")
+        doc.save(path)
+        paths.append(path)
+    return paths
+
+
+# ---------------- Traffic ---------------- #
+def parse_mix(mix: str) -> dict:
+    """Parse "translate=2,currency=6,portfolio=2" into route weights."""
+    weights = {}
+    for part in mix.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip().lstrip("/")
+        if route not in ROUTES:
+            raise ValueError(f"Unknown route in mix: {route}")
+        weights[route] = float(weight or 1)
+    return weights
+
+
+def make_request(route: str, rng: random.Random, corpus: list) -> dict:
+    """Build a random request for `route`."""
+    if route == "translate":
+        return {"route": "/translate", "json": {"text": " ".join(rng.choices(WORDS, k=rng.randint(3, 40))),
+                                                "dest": rng.choice(DEST_LANGS)}}
+    if route == "currency":
+        return {"route": "/currency", "json": {"amount": round(rng.uniform(1, 10000), 2),
+                                               "from": rng.choice(CURRENCIES), "to": rng.choice(CURRENCIES)}}
+    return {"route": "/portfolio", "file": rng.choice(corpus)}
+
+
+def generated_schedule(weights: dict, rate: float, duration: float, corpus: list, seed: int) -> list:
+    """Open-loop schedule of (start offset, request) at a fixed arrival rate."""
+    rng = random.Random(seed)
+    routes, route_weights = zip(*weights.items())
+    return [(i / rate, make_request(rng.choices(routes, route_weights)[0], rng, corpus))
+            for i in range(int(rate * duration))]
+
+
+def replay_schedule(path: str, rate: float, corpus: list, seed: int) -> list:
+    """Schedule of (start offset, request) read from a JSONL traffic log."""
+    rng = random.Random(seed)
+    schedule = []
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(l for l in f if l.strip()):
+            entry = json.loads(line)
+            offset = float(entry.get("ts", i / rate))
+            route = entry.get("route")
+            if route is None:
+                text = entry.get("text") or entry.get("body") or entry.get("title", "")
+                request = {"route": "/translate", "json": {"text": text, "dest": entry.get("dest", "fr")}}
+            elif route == "/portfolio":
+                request = {"route": route, "file": entry.get("file") or rng.choice(corpus)}
+            else:
+                request = {"route": route, "json": entry.get("json", {})}
+            schedule.append((offset, request))
+    return sorted(schedule, key=lambda item: item[0])
+
+
+def send(base_url: str, request: dict, timeout: float):
+    """Send one request; returns (ok, status)."""
+    if "file" in request:
+        boundary = uuid.uuid4().hex
+        with open(request["file"], "rb") as f:
+            content = f.read()
+        body = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{os.path.basename(request["file"])}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+        content_type = f"multipart/form-data; boundary={boundary}"
+    else:
+        body = json.dumps(request["json"]).encode()
+        content_type = "application/json"
+
+    req = urllib.request.Request(base_url + request["route"], data=body, method="POST",
+                                 headers={"Content-Type": content_type})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as res:
+            payload = json.loads(res.read() or b"{}")
+            if isinstance(payload, dict) and "error" in payload:
+                return False, f"{res.status} with error body"
+            return True, res.status
+    except urllib.error.HTTPError as e:
+        return False, e.code
+    except Exception as e:
+        return False, type(e).__name__
+
+
+# ---------------- Process Stats ---------------- #
+def read_process_stats(pid: int):
+    """CPU seconds and RSS bytes of `pid` from /proc (Linux only), or None."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return cpu, rss_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class ProcessSampler(threading.Thread):
+    """Sample a process' CPU time and RSS in the background."""
+
+    def __init__(self, pid: int, interval: float = 0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            sample = read_process_stats(self.pid)
+            if sample:
+                self.samples.append((time.monotonic(), *sample))
+            self.stopped.wait(self.interval)
+
+    def summary(self) -> dict:
+        if len(self.samples) < 2:
+            return {"pid": self.pid, "available": False}
+        (t0, cpu0, _), (t1, cpu1, _) = self.samples[0], self.samples[-1]
+        rss = [sample[2] for sample in self.samples]
+        return {
+            "pid": self.pid,
+            "cpu_seconds": round(cpu1 - cpu0, 2),
+            "cpu_percent": round(100 * (cpu1 - cpu0) / (t1 - t0), 1),
+            "rss_peak_mb": round(max(rss) / 2 ** 20, 1),
+            "rss_end_mb": round(rss[-1] / 2 ** 20, 1),
+        }
+
+
+# ---------------- Runner ---------------- #
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_schedule(base_url: str, schedule: list, concurrency: int, timeout: float) -> tuple:
+    """
+    Fire requests at their scheduled offsets. Latency is measured from the
+    scheduled start, so time spent queued behind a slow server is counted.
+    """
+    results = []
+    lock = threading.Lock()
+
+    def worker(scheduled_at: float, request: dict):
+        ok, status = send(base_url, request, timeout)
+        with lock:
+            results.append((request["route"], ok, status, time.monotonic() - scheduled_at))
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for offset, request in schedule:
+            scheduled_at = start + offset
+            delay = scheduled_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(worker, scheduled_at, request)
+    return results, time.monotonic() - start
+
+
+def build_report(results: list, elapsed: float) -> dict:
+    """Throughput, latency percentiles (ms) and error rate, overall and per route."""
+    def summarise(rows):
+        latencies = [row[3] * 1000 for row in rows]
+        errors = [row for row in rows if not row[1]]
+        return {
+            "requests": len(rows),
+            "throughput_rps": round(len(rows) / elapsed, 1) if elapsed else 0.0,
+            "error_rate": round(len(errors) / len(rows), 3) if rows else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p90_ms": round(percentile(latencies, 90), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies), 1) if latencies else 0.0,
+            "statuses": sorted({str(row[2]) for row in errors}),
+        }
+
+    report = {"elapsed_s": round(elapsed, 2), "overall": summarise(results), "routes": {}}
+    for route in sorted({row[0] for row in results}):
+        report["routes"][route] = summarise([row for row in results if row[0] == route])
+    return report
+
+
+def print_report(report: dict):
+    print(f"\nRan for {report['elapsed_s']}s")
+    header = f"{'route':<12}{'reqs':>7}{'rps':>8}{'err%':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in [*report["routes"].items(), ("overall", report["overall"])]:
+        print(f"{name:<12}{stats['requests']:>7}{stats['throughput_rps']:>8}{stats['error_rate'] * 100:>7.1f}"
+              f"{stats['p50_ms']:>9}{stats['p90_ms']:>9}{stats['p99_ms']:>9}{stats['max_ms']:>9}")
+        if stats["statuses"]:
+            print(f"{'':<12}errors: {', '.join(stats['statuses'])}")
+
+    for process in report.get("processes", []):
+        if process.get("available") is False:
+            print(f"\nprocess {process['pid']}: stats unavailable")
+        else:
+            print(f"\nprocess {process['pid']}: cpu {process['cpu_seconds']}s ({process['cpu_percent']}%), "
+                  f"rss peak {process['rss_peak_mb']} MB, end {process['rss_end_mb']} MB")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(base_url + "/", timeout=1).close()
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not come up within {timeout}s")
+
+
+def run(args):
+    # The synthetic corpus only lives as long as the run
+    with tempfile.TemporaryDirectory(prefix="loadtest-resumes-") as corpus_dir:
+        return run_with_corpus(args, build_resume_corpus(corpus_dir, args.corpus_size))
+
+
+def run_with_corpus(args, corpus: list):
+    if args.replay:
+        schedule = replay_schedule(args.replay, args.rate, corpus, args.seed)
+    else:
+        schedule = generated_schedule(parse_mix(args.mix), args.rate, args.duration, corpus, args.seed)
+
+    server = None
+    pids = list(args.pid)
+    base_url = args.url
+    if not base_url:
+        port = free_port()
+        server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve", "--port", str(port),
+                                   "--translate-latency", str(args.translate_latency)],
+                                  stdout=subprocess.DEVNULL)
+        pids.append(server.pid)
+        base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        wait_until_up(base_url)
+        samplers = [ProcessSampler(pid) for pid in pids]
+        for sampler in samplers:
+            sampler.start()
+
+        print(f"Sending {len(schedule)} requests to {base_url} ...")
+        results, elapsed = run_schedule(base_url, schedule, args.concurrency, args.timeout)
+
+        for sampler in samplers:
+            sampler.stopped.set()
+            sampler.join()
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    report = build_report(results, elapsed)
+    report["processes"] = [sampler.summary() for sampler in samplers]
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["overall"]["error_rate"] > args.max_error_rate else 0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Load-test harness for the API hub.")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = commands.add_parser("serve", help="run the app with the fake translation backend")
+    serve_cmd.add_argument("--port", type=int, default=5001)
+    serve_cmd.add_argument("--translate-latency", type=float, default=0.05)
+
+    run_cmd = commands.add_parser("run", help="generate or replay traffic and report")
+    run_cmd.add_argument("--url", help="target an already running server instead of starting one")
+    run_cmd.add_argument("--pid", type=int, action="append", default=[], help="server process to sample (repeatable)")
+    run_cmd.add_argument("--mix", default="translate=2,currency=6,portfolio=2", help="route weights")
+    run_cmd.add_argument("--rate", type=float, default=20.0, help="open-loop arrival rate (requests/s)")
+    run_cmd.add_argument("--duration", type=float, default=10.0, help="seconds of generated traffic")
+    run_cmd.add_argument("--replay", help="JSONL traffic log to replay instead of generating")
+    run_cmd.add_argument("--concurrency", type=int, default=64, help="max in-flight requests")
+    run_cmd.add_argument("--timeout", type=float, default=30.0)
+    run_cmd.add_argument("--corpus-size", type=int, default=10, help="synthetic resumes to generate")
+    run_cmd.add_argument("--translate-latency", type=float, default=0.05, help="fake translator delay (s)")
+    run_cmd.add_argument("--seed", type=int, default=0)
+    run_cmd.add_argument("--json", help="also write the report to this file")
+    run_cmd.add_argument("--max-error-rate", type=float, default=0.01, help="exit non-zero above this")
+
+    args = arg_parser.parse_args()
+    if args.command == "serve":
+        serve(args.port, args.translate_latency)
+        return 0
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Concurrency stress check for the service layer.
+
+Hammers the shared state of the services from many threads at once:
+- the translation cache, through concurrent translate_lines calls
+- the spaCy pipeline pool in parser_1
+- /currency, /portfolio and multilingual /portfolio requests through
+  Flask's test client
+
+Translations come from a local stub translator. Every concurrent answer is
+compared with a single-threaded baseline, and the cache size, pipeline pool
+size and leftover uploads are checked afterwards.
+
+Usage: python tools/stress_concurrency.py [--threads 16] [--rounds 20] [--resume "uploads/Rishi 2.pdf"]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import services.translator
+from app import app, UPLOAD_FOLDER
+from tools.stub_translator import StubTranslator
+
+SPANISH_RESUME = [
+    "Maria Garcia",
+    "maria.garcia@example.com",
+    "Resumen",
+    "Desarrolladora con experiencia en el desarrollo de aplicaciones web para la banca",
+    "Habilidades",
+    "Python, Flask, SQL, Docker",
+    "Experiencia",
+    "Desarrolladora de software en Acme 2018 - 2022",
+    "Educación",
+    "Ingeniería Informática, Universidad de Madrid 2017",
+]
+
+
+def write_spanish_resume(directory: str) -> str:
+    import docx
+
+    doc = docx.Document()
+    for line in SPANISH_RESUME:
+        doc.add_paragraph(line)
+    path = os.path.join(directory, "curriculum.docx")
+    doc.save(path)
+    return path
+
+
+def translate_lines_call(i):
+    lines = (f"Encabezado {i % 50}", f"Campo {i % 7}", "Experiencia")
+    source = ("es", "fr", "de")[i % 3]
+    return ("translate_lines", lines, source), services.translator.translate_lines(list(lines), source, "en")
+
+
+def expected_translation(key):
+    _, lines, source = key
+    return {line: f"[{source}>en] {line}" for line in lines}
+
+
+def nlp_call(i):
+    from services.parser_1 import extract_contact_info
+
+    return ("nlp",), extract_contact_info("Maria Garcia, Berlin, maria@example.com, +49 30 1234 5678")
+
+
+def currency_call(client, i):
+    amount = i % 100 + 1
+    res = client.post("/currency", json={"amount": amount, "from": "EUR", "to": "INR"})
+    return ("currency", amount), res.get_json()
+
+
+def portfolio_call(client, resume_path, multilingual=False):
+    with open(resume_path, "rb") as f:
+        res = client.post(
+            "/portfolio",
+            data={"file": (f, os.path.basename(resume_path)), "multilingual": "true" if multilingual else ""},
+            content_type="multipart/form-data",
+        )
+    return ("portfolio", resume_path, multilingual), res.get_json()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--threads", type=int, default=16)
+    arg_parser.add_argument("--rounds", type=int, default=20)
+    arg_parser.add_argument("--resume", default=os.path.join(UPLOAD_FOLDER, "Rishi 2.pdf"))
+    args = arg_parser.parse_args()
+
+    StubTranslator.latency = 0.001  # let other threads interleave
+    services.translator.GoogleTranslator = StubTranslator
+    uploads_before = set(os.listdir(UPLOAD_FOLDER))
+
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        spanish_resume = write_spanish_resume(corpus_dir)
+        calls = [
+            lambda i: translate_lines_call(i),
+            lambda i: nlp_call(i),
+            lambda i: currency_call(app.test_client(), i),
+            lambda i: portfolio_call(app.test_client(), args.resume),
+            lambda i: portfolio_call(app.test_client(), spanish_resume, multilingual=True),
+        ]
+
+        # Single-threaded baseline to compare every concurrent answer against;
+        # translate_lines answers are checked against the stub directly
+        expected = {}
+        for i in range(100):
+            for call in calls[1:3]:
+                key, result = call(i)
+                expected[key] = result
+        for call in calls[3:]:
+            key, result = call(0)
+            expected[key] = result
+        services.translator.TRANSLATION_CACHE.clear()
+
+        jobs = []
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            for i in range(args.rounds * args.threads):
+                jobs.append(pool.submit(calls[i % len(calls)], i))
+
+        mismatches = 0
+        for job in jobs:
+            key, result = job.result()
+            wanted = expected_translation(key) if key[0] == "translate_lines" else expected[key]
+            if result != wanted:
+                mismatches += 1
+                print(f"❌ {key}: {result} != {wanted}")
+
+    problems = []
+    leftovers = set(os.listdir(UPLOAD_FOLDER)) - uploads_before
+    if leftovers:
+        problems.append(f"uploads left behind: {sorted(leftovers)}")
+
+    # 50 headers + 7 fields + "Experiencia" per source language, plus the resume lines
+    cache = services.translator.TRANSLATION_CACHE
+    for source in ("es", "fr", "de"):
+        if len(cache.get((source, "en"), {})) > 58 + len(SPANISH_RESUME):
+            problems.append(f"translation cache for {source} grew to {len(cache[(source, 'en')])} entries")
+
+    import services.parser_1
+    if services.parser_1._nlp_loaded > services.parser_1.NLP_POOL_SIZE:
+        problems.append(f"{services.parser_1._nlp_loaded} spaCy pipelines loaded, pool size is {services.parser_1.NLP_POOL_SIZE}")
+
+    for problem in problems:
+        print(f"❌ {problem}")
+    print(f"{len(jobs)} calls on {args.threads} threads: {mismatches} mismatches, {len(problems)} other problems")
+    return 1 if mismatches or problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""Local stand-in for deep_translator's GoogleTranslator, shared by tests and tools."""
+import time
+
+
+class StubTranslator:
+    """
+    Deterministic offline translator: tags every line with the language pair,
+    e.g. "Experiencia" -> "[es>en] Experiencia", after an optional delay.
+    Install it with `services.translator.GoogleTranslator = StubTranslator`.
+    """
+
+    latency = 0.0
+
+    def __init__(self, source: str = "auto", target: str = "en"):
+        self.tag = f"[{source}>{target}]"
+
+    def translate(self, text: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return "\n".join(f"{self.tag} {line}" for line in text.split("\n"))